@@ -1,14 +1,21 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import socketio
 from dotenv import load_dotenv
 import os
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional, Set
 
 from app.services.speech_service import SpeechService
 from app.services.translation_service import TranslationService
 from app.services.tts_service import TextToSpeechService
 from app.services.user_service import UserService
+from app.services.language_service import (
+    LanguageService,
+    DEFAULT_SOURCE_LANGUAGE,
+    DEFAULT_TARGET_LANGUAGE,
+)
+from app.models.language_profile import LanguageProfile
 from app.routes import auth
 
 # Load environment variables
@@ -29,10 +36,16 @@ socket_app = socketio.ASGIApp(sio, app)
 # Store active users and their socket IDs
 active_users = {}
 # Store active calls
-active_calls = {}
+active_calls: Dict[str, str] = {}  # username -> peer username
 # Store friend requests and friends
 friend_requests: Dict[str, List[str]] = {}  # username -> [requesting_usernames]
 friends: Dict[str, List[str]] = {}  # username -> [friend_usernames]
+# Store resolved language profiles per socket
+language_profiles: Dict[str, LanguageProfile] = {}  # sid -> profile
+# Language pairs ((STT, TTS) codes) whose caches and channels are already warm
+warmed_language_pairs: Set[FrozenSet[str]] = set()
+# Keep references to fire-and-forget tasks until they finish
+background_tasks: Set[asyncio.Task] = set()
 
 # Configure CORS
 app.add_middleware(
@@ -46,6 +59,66 @@ app.add_middleware(
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["authentication"])
 
+def run_in_background(coro):
+    """
+    Schedule a coroutine, keeping a reference until it finishes and logging failures
+    """
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+
+    def on_done(task: asyncio.Task):
+        background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Error in background task: {str(task.exception())}")
+
+    task.add_done_callback(on_done)
+    return task
+
+async def warm_up_language_pair(source: LanguageProfile, target: LanguageProfile):
+    """
+    Speculatively warm STT, translation and TTS channels/caches for a language pair
+    """
+    pair = frozenset((
+        (source.stt_language_code, source.tts_language_code),
+        (target.stt_language_code, target.tts_language_code),
+    ))
+    if pair in warmed_language_pairs:
+        return
+
+    results = await asyncio.gather(
+        translation_service.warm_up(),
+        *(speech_service.warm_up(stt_code) for stt_code, _ in pair),
+        *(tts_service.warm_up(tts_code) for _, tts_code in pair)
+    )
+    if all(results):
+        warmed_language_pairs.add(pair)
+
+def get_username(sid: str) -> Optional[str]:
+    return next((user for user, s_id in active_users.items() if s_id == sid), None)
+
+def get_call_peer_profile(sid: str) -> Optional[LanguageProfile]:
+    peer_sid = active_users.get(active_calls.get(get_username(sid)))
+    return language_profiles.get(peer_sid)
+
+def get_default_target_profile(sid: str, source: LanguageProfile) -> LanguageProfile:
+    """
+    Prefer the call peer's profile, then the defaults, skipping the source language
+    """
+    candidates = [
+        get_call_peer_profile(sid),
+        LanguageService.resolve(DEFAULT_TARGET_LANGUAGE),
+        LanguageService.resolve(DEFAULT_SOURCE_LANGUAGE),
+    ]
+    return next(
+        (profile for profile in candidates if profile and profile.language != source.language),
+        candidates[1]
+    )
+
+def end_active_call(username: Optional[str]):
+    peer_username = active_calls.pop(username, None)
+    if peer_username:
+        active_calls.pop(peer_username, None)
+
 # Socket.IO events
 @sio.on('connect')
 async def connect(sid, environ):
@@ -53,13 +126,15 @@ async def connect(sid, environ):
 
 @sio.on('disconnect')
 async def disconnect(sid):
-    username = next((user for user, s_id in active_users.items() if s_id == sid), None)
+    username = get_username(sid)
     if username:
         # Kullanıcının online durumunu güncelle
         await UserService.update_online_status(username, False)
         del active_users[username]
+        end_active_call(username)
         # Notify other users about offline status
         await sio.emit('user_offline', {'username': username}, skip_sid=sid)
+    language_profiles.pop(sid, None)
     print(f'Client disconnected: {sid}')
 
 @sio.on('register_user')
@@ -67,8 +142,11 @@ async def register_user(sid, data):
     username = data.get('username')
     if username:
         # Kullanıcının online durumunu güncelle
-        await UserService.update_online_status(username, True)
+        user = await UserService.update_online_status(username, True)
         active_users[username] = sid
+        # Dil profilini soket başına bir kez çöz ve önbelleğe al
+        preferred_language = (user or {}).get('preferred_language') or DEFAULT_SOURCE_LANGUAGE
+        language_profiles[sid] = LanguageService.resolve(preferred_language)
         # Notify other users about online status
         await sio.emit('user_online', {'username': username}, skip_sid=sid)
 
@@ -98,6 +176,13 @@ async def call_user(sid, data):
         
     # Arama bildirimini hedef kullanıcıya gönder
     callee_sid = active_users[callee_username]
+
+    # Yeni arama için dil çiftini önceden ısıt
+    default_profile = LanguageService.resolve(DEFAULT_SOURCE_LANGUAGE)
+    run_in_background(warm_up_language_pair(
+        language_profiles.get(sid, default_profile),
+        language_profiles.get(callee_sid, default_profile)
+    ))
     await sio.emit('incoming_call', {
         'caller': caller_username,
         'offer': offer
@@ -124,6 +209,12 @@ async def call_response(sid, data):
             await sio.emit('error', {'message': 'Missing answer data'}, room=sid)
             return
             
+        # Görüşmenin taraflarını kaydet (çeviri hedef dili için)
+        callee_username = get_username(sid)
+        if callee_username:
+            active_calls[caller_username] = callee_username
+            active_calls[callee_username] = caller_username
+
         # Kabul edildiğinde answer'ı gönder
         await sio.emit('call_accepted', {
             'answer': answer
@@ -159,6 +250,8 @@ async def end_call(sid, data):
         await sio.emit('error', {'message': 'Invalid end call data'}, room=sid)
         return
         
+    end_active_call(target_username)
+
     if target_username in active_users:
         # Karşı tarafa aramanın sonlandırıldığını bildir
         target_sid = active_users[target_username]
@@ -168,22 +261,43 @@ async def end_call(sid, data):
 @sio.on('audio_data')
 async def handle_audio(sid, data):
     try:
+        # Languages picked explicitly on the client override the cached profiles:
+        # source falls back to the speaker's profile, target to a different language
+        # (the call peer's if possible)
+        source_language = data.get('source_language')
+        target_language = data.get('target_language')
+        source = (
+            LanguageService.resolve(source_language) if source_language
+            else language_profiles.get(sid) or LanguageService.resolve(DEFAULT_SOURCE_LANGUAGE)
+        )
+        target = (
+            LanguageService.resolve(target_language) if target_language
+            else get_default_target_profile(sid, source)
+        )
+
+        if not translation_service.is_supported(source.language) or not translation_service.is_supported(target.language):
+            await sio.emit('error', {'message': 'Unsupported language'}, room=sid)
+            return
+
         # 1. Convert audio to text
         text = await speech_service.transcribe_audio(
             audio_content=data['audio'],
-            language_code=data.get('source_language', 'tr-TR')
+            language_code=source.stt_language_code
         )
         
         if not text:
             await sio.emit('error', {'message': 'No speech detected'}, room=sid)
             return
 
-        # 2. Translate text
-        translated_text = await translation_service.translate_text(
-            text=text,
-            source_language=data.get('source_language', 'tr'),
-            target_language=data.get('target_language', 'en')
-        )
+        # 2. Translate text (Translation rejects identical source and target)
+        if source.language == target.language:
+            translated_text = text
+        else:
+            translated_text = await translation_service.translate_text(
+                text=text,
+                source_language=source.language,
+                target_language=target.language
+            )
         
         if not translated_text:
             await sio.emit('error', {'message': 'Translation failed'}, room=sid)
@@ -192,7 +306,7 @@ async def handle_audio(sid, data):
         # 3. Convert translated text to audio
         audio_content = await tts_service.synthesize_speech(
             text=translated_text,
-            language_code=data.get('target_language', 'en-US')
+            language_code=target.tts_language_code
         )
 
         # 4. Send results back to client
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class LanguageProfile(BaseModel):
+    language: str  # Code used by Translation (e.g. "tr", "zh-CN")
+    stt_language_code: str  # BCP-47 code used by Speech-to-Text (e.g. "cmn-Hans-CN")
+    tts_language_code: str  # BCP-47 code used by Text-to-Speech (e.g. "cmn-CN")
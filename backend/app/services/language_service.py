@@ -0,0 +1,100 @@
+from functools import lru_cache
+from ..models.language_profile import LanguageProfile
+
+DEFAULT_SOURCE_LANGUAGE = "tr"
+DEFAULT_TARGET_LANGUAGE = "en"
+
+# Dil kodu -> Speech-to-Text için kullanılan BCP-47 kodu
+STT_LANGUAGE_CODES = {
+    "tr": "tr-TR",
+    "en": "en-US",
+    "es": "es-ES",
+    "fr": "fr-FR",
+    "de": "de-DE",
+    "it": "it-IT",
+    "pt": "pt-BR",
+    "ru": "ru-RU",
+    "ar": "ar-SA",
+    "ja": "ja-JP",
+    "ko": "ko-KR",
+    "zh": "cmn-Hans-CN",
+    "zh-TW": "cmn-Hant-TW",
+    "yue": "yue-Hant-HK",
+}
+
+# TTS'in bölgeden bağımsız tek bir locale ile sunduğu diller (örn. ar-EG -> ar-XA)
+TTS_FIXED_LOCALES = {
+    "ar": "ar-XA",
+}
+
+# Dil kodu -> Text-to-Speech için kullanılan BCP-47 kodu
+TTS_LANGUAGE_CODES = {
+    **STT_LANGUAGE_CODES,
+    **TTS_FIXED_LOCALES,
+    "zh": "cmn-CN",
+    "zh-TW": "cmn-TW",
+    "yue": "yue-HK",
+}
+
+# Translation'ın kabul etmediği dil kodlarının karşılıkları
+TRANSLATION_ALIASES = {
+    "cmn": "zh",
+    "yue": "zh-TW",
+}
+
+CHINESE_LANGUAGES = ("zh", "cmn", "yue")
+
+class LanguageService:
+    @staticmethod
+    def normalize(language_code: str) -> str:
+        """
+        Normalize a language tag to BCP-47 casing, e.g. "zh_hant_tw" -> "zh-Hant-TW"
+        """
+        parts = language_code.strip().replace("_", "-").split("-")
+        normalized = [parts[0].lower()]
+        for part in parts[1:]:
+            if len(part) == 4:
+                normalized.append(part.title())  # Script, e.g. Hant
+            else:
+                normalized.append(part.upper())  # Region, e.g. TW or 419
+        return "-".join(normalized)
+
+    @staticmethod
+    def translation_code(normalized: str) -> str:
+        """
+        Map a normalized tag to the code Translation expects
+        """
+        parts = normalized.split("-")
+        language = TRANSLATION_ALIASES.get(parts[0], parts[0])
+        if language == "zh":
+            traditional = "Hant" in parts or "TW" in parts or "HK" in parts
+            return "zh-TW" if traditional else "zh-CN"
+        return language
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def resolve(language_code: str) -> LanguageProfile:
+        """
+        Resolve a bare or BCP-47 language code into STT/MT/TTS codes
+        """
+        normalized = LanguageService.normalize(language_code)
+        language = LanguageService.translation_code(normalized)
+        base = normalized.split("-")[0]
+
+        if base in CHINESE_LANGUAGES:
+            # Çince varyantlar Speech/TTS'de kendi kodlarını kullanır (cmn-*, yue-*)
+            key = "yue" if base == "yue" else ("zh-TW" if language == "zh-TW" else "zh")
+            stt_language_code = STT_LANGUAGE_CODES[key]
+            tts_language_code = TTS_LANGUAGE_CODES[key]
+        elif "-" in normalized:
+            stt_language_code = normalized
+            tts_language_code = TTS_FIXED_LOCALES.get(base, normalized)
+        else:
+            stt_language_code = STT_LANGUAGE_CODES.get(base, normalized)
+            tts_language_code = TTS_LANGUAGE_CODES.get(base, normalized)
+
+        return LanguageProfile(
+            language=language,
+            stt_language_code=stt_language_code,
+            tts_language_code=tts_language_code
+        )
@@ -1,8 +1,29 @@
+import asyncio
+from typing import Set
+import grpc
 from google.cloud import speech
 
 class SpeechService:
     def __init__(self):
         self.client = speech.SpeechClient()
+        self.warmed_languages: Set[str] = set()
+
+    async def warm_up(self, language_code: str) -> bool:
+        """
+        Open the gRPC channel ahead of the first recognition without blocking the event loop
+        """
+        if language_code in self.warmed_languages:
+            return True
+
+        try:
+            # Speech-to-Text'in ücretsiz bir metadata çağrısı yok, kanalın hazır olmasını bekle
+            channel = self.client.transport.grpc_channel
+            await asyncio.to_thread(grpc.channel_ready_future(channel).result, timeout=10)
+            self.warmed_languages.add(language_code)
+            return True
+        except Exception as e:
+            print(f"Error warming up speech to text: {str(e)}")
+            return False
 
     async def transcribe_audio(self, audio_content: bytes, language_code: str = "tr-TR"):
         """
@@ -1,9 +1,37 @@
+import asyncio
+from typing import Set
 from google.cloud import translate
 
+PARENT = "projects/prime-service-458411-j6"
+
 class TranslationService:
     def __init__(self):
         self.client = translate.TranslationServiceClient()
-        
+        self.supported_languages: Set[str] = set()
+
+    def is_supported(self, language_code: str) -> bool:
+        """
+        Check a language code against the cached list; unknown until warmed up
+        """
+        if not self.supported_languages:
+            return True
+        return language_code in self.supported_languages or language_code.split("-")[0] in self.supported_languages
+
+    async def warm_up(self) -> bool:
+        """
+        Open the channel and cache the supported language codes
+        """
+        if self.supported_languages:
+            return True
+
+        try:
+            response = await asyncio.to_thread(self.client.get_supported_languages, parent=PARENT)
+            self.supported_languages = {language.language_code for language in response.languages}
+            return True
+        except Exception as e:
+            print(f"Error warming up translation: {str(e)}")
+            return False
+
     async def translate_text(self, text: str, source_language: str, target_language: str):
         """
         Translate text from source language to target language
@@ -11,7 +39,7 @@ class TranslationService:
         try:
             response = self.client.translate_text(
                 request={
-                    "parent": "projects/prime-service-458411-j6",
+                    "parent": PARENT,
                     "contents": [text],
                     "mime_type": "text/plain",
                     "source_language_code": source_language,
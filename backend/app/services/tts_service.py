@@ -1,8 +1,31 @@
+import asyncio
+import os
+from typing import Dict, Set
 from google.cloud import texttospeech
 
 class TextToSpeechService:
     def __init__(self):
         self.client = texttospeech.TextToSpeechClient()
+        # Açıkça yapılandırılmış sesler, örn. TTS_VOICES="en-US=en-US-Neural2-C,tr-TR=tr-TR-Wavenet-A"
+        self.voices: Dict[str, str] = dict(
+            item.split("=", 1) for item in os.getenv("TTS_VOICES", "").split(",") if "=" in item
+        )
+        self.warmed_languages: Set[str] = set()
+
+    async def warm_up(self, language_code: str) -> bool:
+        """
+        Open the channel ahead of the first synthesis without blocking the event loop
+        """
+        if language_code in self.warmed_languages:
+            return True
+
+        try:
+            await asyncio.to_thread(self.client.list_voices, language_code=language_code)
+            self.warmed_languages.add(language_code)
+            return True
+        except Exception as e:
+            print(f"Error warming up text to speech: {str(e)}")
+            return False
 
     async def synthesize_speech(self, text: str, language_code: str = "tr-TR"):
         """
@@ -11,10 +34,17 @@ class TextToSpeechService:
         try:
             synthesis_input = texttospeech.SynthesisInput(text=text)
 
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=language_code,
-                ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-            )
+            voice_name = self.voices.get(language_code)
+            if voice_name:
+                voice = texttospeech.VoiceSelectionParams(
+                    language_code=language_code,
+                    name=voice_name
+                )
+            else:
+                voice = texttospeech.VoiceSelectionParams(
+                    language_code=language_code,
+                    ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
+                )
 
             audio_config = texttospeech.AudioConfig(
                 audio_encoding=texttospeech.AudioEncoding.MP3,
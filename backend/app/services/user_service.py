@@ -136,10 +136,11 @@ class UserService:
             return []
 
     @staticmethod
-    async def update_online_status(username: str, status: bool):
+    async def update_online_status(username: str, status: bool) -> Optional[dict]:
         collection = await get_user_collection()
         try:
-            await collection.update_one(
+            # Kullanıcı belgesini döndür (örn. preferred_language için)
+            return await collection.find_one_and_update(
                 {"username": username},
                 {
                     "$set": {
@@ -149,4 +150,5 @@ class UserService:
                 }
             )
         except Exception as e:
-            print(f"Error updating online status: {str(e)}") 
\ No newline at end of file
+            print(f"Error updating online status: {str(e)}")
+            return None 
\ No newline at end of file
@@ -0,0 +1,50 @@
+import pytest
+
+from app.services.language_service import LanguageService
+
+
+@pytest.mark.parametrize("code, expected", [
+    ("tr", "tr"),
+    ("EN_gb", "en-GB"),
+    ("zh_hant_tw", "zh-Hant-TW"),
+    ("es-419", "es-419"),
+])
+def test_normalize(code, expected):
+    assert LanguageService.normalize(code) == expected
+
+
+@pytest.mark.parametrize("normalized, expected", [
+    ("tr-TR", "tr"),
+    ("zh", "zh-CN"),
+    ("zh-Hans-CN", "zh-CN"),
+    ("zh-Hant-TW", "zh-TW"),
+    ("zh-HK", "zh-TW"),
+    ("cmn-CN", "zh-CN"),
+    ("yue-HK", "zh-TW"),
+])
+def test_translation_code(normalized, expected):
+    assert LanguageService.translation_code(normalized) == expected
+
+
+@pytest.mark.parametrize("code, language, stt, tts", [
+    # Bare codes use the region tables
+    ("tr", "tr", "tr-TR", "tr-TR"),
+    ("en", "en", "en-US", "en-US"),
+    ("ar", "ar", "ar-SA", "ar-XA"),
+    # Regional codes are kept, except where TTS has a single locale
+    ("tr-TR", "tr", "tr-TR", "tr-TR"),
+    ("en_gb", "en", "en-GB", "en-GB"),
+    ("ar-EG", "ar", "ar-EG", "ar-XA"),
+    # Chinese variants
+    ("zh", "zh-CN", "cmn-Hans-CN", "cmn-CN"),
+    ("cmn-CN", "zh-CN", "cmn-Hans-CN", "cmn-CN"),
+    ("zh-Hant-TW", "zh-TW", "cmn-Hant-TW", "cmn-TW"),
+    ("zh-HK", "zh-TW", "cmn-Hant-TW", "cmn-TW"),
+    ("yue", "zh-TW", "yue-Hant-HK", "yue-HK"),
+])
+def test_resolve(code, language, stt, tts):
+    profile = LanguageService.resolve(code)
+
+    assert profile.language == language
+    assert profile.stt_language_code == stt
+    assert profile.tts_language_code == tts
@@ -1,6 +1,5 @@
 import React, { useEffect, useRef, useState } from "react";
 import styled from "styled-components";
-import io, { Socket } from "socket.io-client";
 import { theme } from "../styles/theme";
 
 interface TranslationInterfaceProps {
@@ -48,24 +47,21 @@ const TranslationInterface: React.FC<TranslationInterfaceProps> = ({
   socket,
 }) => {
   const [isRecording, setIsRecording] = useState(false);
-  const [sourceLanguage, setSourceLanguage] = useState("tr");
-  const [targetLanguage, setTargetLanguage] = useState("en");
+  // Boş değer: kaynak için kullanıcının profili, hedef için kaynaktan farklı bir dil
+  // (görüşme karşısındakinin profili, yoksa English) sunucuda seçilir
+  const [sourceLanguage, setSourceLanguage] = useState("");
+  const [targetLanguage, setTargetLanguage] = useState("");
   const [originalText, setOriginalText] = useState("");
   const [translatedText, setTranslatedText] = useState("");
 
-  const socketRef = useRef<Socket | null>(null);
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const audioChunksRef = useRef<Blob[]>([]);
 
   useEffect(() => {
-    // Connect to WebSocket server
-    socketRef.current = io("http://localhost:8000");
+    if (!socket) return;
 
-    socketRef.current.on("connect", () => {
-      console.log("Connected to WebSocket server");
-    });
-
-    socketRef.current.on("translation_result", (data: any) => {
+    // Use the registered socket so the server can apply the language profile
+    const handleTranslationResult = (data: any) => {
       setOriginalText(data.original_text);
       setTranslatedText(data.translated_text);
 
@@ -80,16 +76,20 @@ const TranslationInterface: React.FC<TranslationInterfaceProps> = ({
       audio.play().catch((error) => {
         console.error("Error playing audio:", error);
       });
-    });
+    };
 
-    socketRef.current.on("error", (error: any) => {
+    const handleError = (error: any) => {
       console.error("Translation error:", error);
-    });
+    };
+
+    socket.on("translation_result", handleTranslationResult);
+    socket.on("error", handleError);
 
     return () => {
-      socketRef.current?.disconnect();
+      socket.off("translation_result", handleTranslationResult);
+      socket.off("error", handleError);
     };
-  }, []);
+  }, [socket]);
 
   const startRecording = async () => {
     try {
@@ -115,10 +115,10 @@ const TranslationInterface: React.FC<TranslationInterfaceProps> = ({
 
         reader.onloadend = () => {
           const arrayBuffer = reader.result as ArrayBuffer;
-          socketRef.current?.emit("audio_data", {
+          socket?.emit("audio_data", {
             audio: arrayBuffer,
-            source_language: sourceLanguage,
-            target_language: targetLanguage,
+            ...(sourceLanguage && { source_language: sourceLanguage }),
+            ...(targetLanguage && { target_language: targetLanguage }),
           });
         };
       };
@@ -144,6 +144,7 @@ const TranslationInterface: React.FC<TranslationInterfaceProps> = ({
           value={sourceLanguage}
           onChange={(e) => setSourceLanguage(e.target.value)}
         >
+          <option value="">Profil dili</option>
           <option value="tr">Türkçe</option>
           <option value="en">English</option>
           <option value="es">Español</option>
@@ -154,6 +155,7 @@ const TranslationInterface: React.FC<TranslationInterfaceProps> = ({
           value={targetLanguage}
           onChange={(e) => setTargetLanguage(e.target.value)}
         >
+          <option value="">Otomatik (karşı taraf, yoksa English)</option>
           <option value="en">English</option>
           <option value="tr">Türkçe</option>
           <option value="es">Español</option>